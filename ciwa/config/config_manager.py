@@ -18,9 +18,20 @@ Example usage
     "voting_method": {"type": "RankingCompare"}})
 """
 
-from typing import Dict, Any
+import copy
+import os
+from typing import Dict, Any, Tuple
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+
+# Parsed config files keyed by path, with the (st_mtime_ns, st_size) they were parsed at.
+_config_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
 
 class ConfigManager:
     """
@@ -41,13 +52,20 @@ class ConfigManager:
 
     def _init_from_file(self, config_path: str) -> None:
         """
-        Initialize the configuration from a YAML file.
+        Initialize the configuration from a YAML file. The file is only re-parsed
+        when its modification time or size changes; each instance gets its own copy.
 
         Args:
             config_path (str): The path to the configuration file.
         """
-        with open(config_path, "r", encoding="utf-8") as file:
-            self.config = yaml.safe_load(file)
+        stat = os.stat(config_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _config_cache.get(config_path)
+        if cached is None or cached[0] != signature:
+            with open(config_path, "r", encoding="utf-8") as file:
+                cached = (signature, yaml.load(file, Loader=SafeLoader))
+            _config_cache[config_path] = cached
+        self.config = copy.deepcopy(cached[1])
 
     def _init_from_dict(self, config_dict: Dict[str, Any]) -> None:
         """
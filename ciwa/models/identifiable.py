@@ -6,6 +6,7 @@ UUID-based identification for objects.
 """
 
 from abc import ABC
+from typing import Optional
 from uuid import uuid4, UUID
 
 
@@ -15,7 +16,8 @@ class IdentifiableMixin:
     """
 
     def __init__(self) -> None:
-        self._uuid: UUID = uuid4()
+        # Generated on first access, so objects whose UUID is never read skip uuid4().
+        self._uuid: Optional[UUID] = None
 
     @property
     def uuid(self) -> str:
@@ -25,6 +27,8 @@ class IdentifiableMixin:
         Returns:
             str: The UUID of the object.
         """
+        if self._uuid is None:
+            self._uuid = uuid4()
         return str(self._uuid)
 
     def get_id_str(self) -> str:
@@ -1,6 +1,21 @@
 # ciwa/models/participants/__init__.py
 
 from .participant import Participant
-from .conversable_agent_participant import ConversableAgentParticipant
 from .llm_agent_participant import LLMAgentParticipant
 from .participant_factory import ParticipantFactory
+
+__all__ = [
+    "Participant",
+    "LLMAgentParticipant",
+    "ConversableAgentParticipant",
+    "ParticipantFactory",
+]
+
+
+def __getattr__(name):
+    # ConversableAgentParticipant pulls in autogen, so only import it on first use.
+    if name == "ConversableAgentParticipant":
+        from .conversable_agent_participant import ConversableAgentParticipant
+
+        return ConversableAgentParticipant
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
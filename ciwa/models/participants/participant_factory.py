@@ -6,9 +6,6 @@ Factory class for creating participants.
 
 import logging
 from ciwa.models.participants.llm_agent_participant import LLMAgentParticipant
-from ciwa.models.participants.conversable_agent_participant import (
-    ConversableAgentParticipant,
-)
 
 
 class ParticipantFactory:
@@ -36,6 +33,11 @@ class ParticipantFactory:
         if type == "LLMAgentParticipant":
             return LLMAgentParticipant(process=process, **kwargs)
         elif type == "ConversableAgentParticipant":
+            # Deferred so autogen is only imported when an agent is actually created.
+            from ciwa.models.participants.conversable_agent_participant import (
+                ConversableAgentParticipant,
+            )
+
             model = kwargs.pop("model")
             if not model:
                 logging.error(
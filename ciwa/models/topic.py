@@ -161,7 +161,8 @@ class TopicFactory:
         """
         title = kwargs.pop("title", "")
         description = kwargs.pop("description", "")
-        voting_method_config = kwargs.pop("voting_method", {})
+        # Copy so the caller's config can be reused to create further topics.
+        voting_method_config = dict(kwargs.pop("voting_method", {}))
         voting_method = voting_method_config.pop("type")
 
         return Topic(
@@ -12,6 +12,7 @@ from typing import List, Type, Dict, Any
 import jsonschema
 from ciwa.models.voting_methods.voting_method_registry import get_voting_method
 from ciwa.models.voting_results import LabelVotingResults, CompareVotingResults
+from ciwa.utils import json_utils
 
 
 class VotingManager(ABC):
@@ -121,7 +122,7 @@ class LabelVotingManager(VotingManager):
             vote_prompt=self.voting_method.get_vote_prompt(submission),
         )
         try:
-            jsonschema.validate(instance=vote_json, schema=self.schema)
+            json_utils.get_validator(self.schema).validate(vote_json)
             self.results.add_vote(participant.uuid, {submission.uuid: vote_json})
         except jsonschema.ValidationError as e:
             logging.error("Invalid vote data: %s", e.message)
@@ -171,7 +172,7 @@ class CompareVotingManager(VotingManager):
             vote_prompt=self.voting_method.get_vote_prompt(submissions),
         )
         try:
-            jsonschema.validate(instance=vote_json, schema=self.schema)
+            json_utils.get_validator(self.schema).validate(vote_json)
             self.results.add_vote(participant.uuid, vote_json)
             logging.info(
                 "Compare vote for topic %s from participant %s added to results.",
@@ -224,6 +225,6 @@ class VotingManagerFactory:
             ValueError: If an invalid voting method is provided.
         """
         voting_method_class = get_voting_method(voting_method)
-        if voting_method_class.is_label():
+        if voting_method_class.is_label:
             return LabelVotingManager(voting_method_class, topic, **kwargs)
         return CompareVotingManager(voting_method_class, topic, **kwargs)
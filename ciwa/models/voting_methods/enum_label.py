@@ -4,6 +4,7 @@ This module contains the EnumLabel class, a concrete implementation
 of the LabelVotingMethod, which applies a label vote based on enumerated values.
 """
 
+from collections import Counter
 from typing import List, Dict, Any
 from ciwa.models.voting_methods.voting_method import LabelVotingMethod
 from ciwa.utils.json_utils import SchemaFactory
@@ -15,10 +16,14 @@ class EnumLabel(LabelVotingMethod):
     Concrete VotingMethod class that applies a label vote based on enumerated values.
     """
 
+    __slots__ = ("enum_values", "vote_schema")
+
     def __init__(self, enum_values: List[str]):
         super().__init__()
         self.enum_values = enum_values
-        self.vote_schema = self.get_vote_schema()
+        self.vote_schema = SchemaFactory.create_object_schema(
+            "vote", {"type": "string", "enum": self.enum_values}
+        )
 
     def process_votes(
         self, voting_results: VotingResults, submission_ids: List[str]
@@ -36,21 +41,29 @@ class EnumLabel(LabelVotingMethod):
             Dict[str, Any]: The result of the vote processing, specific to the voting_method.
         """
         # Validate votes against submission_ids (implementation needed)
-        results = {
-            submission_id: {value: 0 for value in self.enum_values}
-            for submission_id in submission_ids
-        }
+        counts = {submission_id: Counter() for submission_id in submission_ids}
         for submission_id, votes in voting_results.votes_data.items():
-            for vote in votes.values():
-                results[submission_id][vote["vote"]] += 1
-        return results
+            counts[submission_id].update(vote["vote"] for vote in votes.values())
+        # Labels outside enum_values are an error rather than silently dropped.
+        enum_values = set(self.enum_values)
+        for submission_id, counter in counts.items():
+            unknown = counter.keys() - enum_values
+            if unknown:
+                raise KeyError(
+                    f"Votes {sorted(unknown)} for submission {submission_id} are not "
+                    f"one of {self.enum_values}"
+                )
+        return {
+            submission_id: {value: counter[value] for value in self.enum_values}
+            for submission_id, counter in counts.items()
+        }
 
     def get_vote_schema(self, **kwargs) -> Dict[str, Any]:
         """
-        Returns the JSON schema for the vote data.
+        Returns the JSON schema for the vote data. The schema depends only on
+        enum_values, so it is built once in __init__.
         """
-        vote_structure = {"type": "string", "enum": self.enum_values}
-        return SchemaFactory.create_object_schema("vote", vote_structure)
+        return self.vote_schema
 
     def __str__(self) -> str:
         return "Enum Label Method"
@@ -4,7 +4,8 @@ This module contains the RankingCompare class, a concrete implementation
 of the CompareVotingMethod, which aggregates votes based on ranking.
 """
 
-from typing import Dict, Any, List
+from operator import itemgetter
+from typing import Dict, Any, List, Tuple
 from ciwa.models.voting_methods.voting_method import CompareVotingMethod
 from ciwa.utils.json_utils import SchemaFactory
 from ciwa.models.voting_results import VotingResults
@@ -17,9 +18,12 @@ class RankingCompare(CompareVotingMethod):
     Concrete VotingMethod class that aggregates votes based on ranking.
     """
 
+    __slots__ = ("submission_index_array", "_schema_cache")
+
     def __init__(self):
         super().__init__()
-        self.submission_index_map = {}
+        self.submission_index_array: Tuple[str, ...] = ()
+        self._schema_cache: Dict[int, Dict[str, Any]] = {}
 
     def process_votes(
         self, voting_results: VotingResults, submission_ids: List[str]
@@ -33,21 +37,17 @@ class RankingCompare(CompareVotingMethod):
         Returns:
             Dict[str, Any]: The aggregated result of the votes.
         """
-        results = {}
-        total_scores = {submission_id: 0 for submission_id in submission_ids}
+        total_scores = dict.fromkeys(submission_ids, 0)
 
-        voter_count = 0
-        for _, vote_data in voting_results.votes_data.items():
-            voter_count += 1
+        submission_index_array = self.submission_index_array
+        voter_count = len(voting_results.votes_data)
+        for vote_data in voting_results.votes_data.values():
             for rank, index in enumerate(vote_data["vote"]):
-                submission_id = self.submission_index_map[index]
-                total_scores[submission_id] += rank
+                total_scores[submission_index_array[index - 1]] += rank
 
         results = {
             submission_id: round(total / voter_count, ROUND_NDIGITS)
-            for submission_id, total in sorted(
-                total_scores.items(), key=lambda item: item[1]
-            )
+            for submission_id, total in sorted(total_scores.items(), key=itemgetter(1))
         }
 
         return results
@@ -55,7 +55,7 @@ class RankingCompare(CompareVotingMethod):
     def get_vote_prompt(self, submissions: List["Submission"], **kwargs) -> str:
         """
         Generates a prompt for ranking the submissions based on their contents and
-        creates a mapping from indices to submission IDs.
+        records the submission IDs in prompt order.
 
         Args:
             submissions (List[Submission]): The submissions.
@@ -63,9 +63,9 @@ class RankingCompare(CompareVotingMethod):
         Returns:
             str: The generated prompt for ranking.
         """
-        self.submission_index_map = {
-            i + 1: submissions[i].uuid for i in range(len(submissions))
-        }
+        self.submission_index_array = tuple(
+            submission.uuid for submission in submissions
+        )
         return super().get_vote_prompt(submissions, **kwargs)
 
     def get_vote_schema(self, num_submissions: int, **kwargs) -> Dict[str, Any]:
@@ -75,6 +75,10 @@ class RankingCompare(CompareVotingMethod):
         Returns:
             Dict[str, Any]: The schema for validating the rankings.
         """
+        schema = self._schema_cache.get(num_submissions)
+        if schema is not None:
+            return schema
+
         vote_structure = {
             "type": "array",
             "title": "List of Unique Integers representing the preferred order of submissions",
@@ -89,7 +93,9 @@ class RankingCompare(CompareVotingMethod):
             "maxItems": num_submissions,
             "minItems": num_submissions,
         }
-        return SchemaFactory.create_object_schema("vote", vote_structure)
+        schema = SchemaFactory.create_object_schema("vote", vote_structure)
+        self._schema_cache[num_submissions] = schema
+        return schema
 
     def __str__(self) -> str:
         return "Ranking Compare Method"
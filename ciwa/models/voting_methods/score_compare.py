@@ -4,6 +4,7 @@ This module contains the ScoreCompare class, a concrete implementation
 of the CompareVotingMethod, which aggregates scores assigned to submissions.
 """
 
+from operator import itemgetter
 from typing import Dict, Any, List
 from ciwa.models.voting_methods.voting_method import CompareVotingMethod
 from ciwa.utils.json_utils import SchemaFactory
@@ -17,12 +18,21 @@ class ScoreCompare(CompareVotingMethod):
     Concrete VotingMethod class that aggregates scores assigned to submissions.
     """
 
+    __slots__ = (
+        "start_value",
+        "end_value",
+        "increment_value",
+        "submission_key_map",
+        "_schema_cache",
+    )
+
     def __init__(self, start_value: int, end_value: int, increment_value: int = None):
         super().__init__()
         self.start_value = start_value
         self.end_value = end_value
         self.increment_value = increment_value
-        self.submission_index_map = {}
+        self.submission_key_map: Dict[str, str] = {}
+        self._schema_cache: Dict[int, Dict[str, Any]] = {}
 
     def process_votes(
         self, voting_results: VotingResults, submission_ids: List[str]
@@ -35,22 +45,17 @@ class ScoreCompare(CompareVotingMethod):
         Returns:
             Dict[str, Any]: The aggregated result of the votes.
         """
-        results = {}
-        total_scores = {submission_id: 0 for submission_id in submission_ids}
+        total_scores = dict.fromkeys(submission_ids, 0)
 
-        voter_count = 0
-        for _, vote_data in voting_results.votes_data.items():
-            voter_count += 1
-            for submission_i, score in vote_data["vote"].items():
-                index = int(submission_i.replace("submission_", ""))
-                submission_id = self.submission_index_map[index]
-                total_scores[submission_id] += score
+        submission_key_map = self.submission_key_map
+        voter_count = len(voting_results.votes_data)
+        for vote_data in voting_results.votes_data.values():
+            for submission_key, score in vote_data["vote"].items():
+                total_scores[submission_key_map[submission_key]] += score
 
         results = {
             submission_id: round(total / voter_count, ROUND_NDIGITS)
-            for submission_id, total in sorted(
-                total_scores.items(), key=lambda item: item[1]
-            )
+            for submission_id, total in sorted(total_scores.items(), key=itemgetter(1))
         }
 
         return results
@@ -76,8 +81,10 @@ class ScoreCompare(CompareVotingMethod):
         else:
             values_str = f"{str(self.start_value)} to {str(self.end_value)}"
 
-        self.submission_index_map = {
-            i + 1: submissions[i].uuid for i in range(len(submissions))
+        # Map the "submission_<n>" keys used in the vote schema straight to UUIDs
+        self.submission_key_map = {
+            f"submission_{i + 1}": submission.uuid
+            for i, submission in enumerate(submissions)
         }
         return super().get_vote_prompt(submissions, values=values_str, **kwargs)
 
@@ -88,7 +95,11 @@ class ScoreCompare(CompareVotingMethod):
         Returns:
             Dict[str, Any]: The schema for validating the scores.
         """
-        return SchemaFactory.create_object_schema(
+        schema = self._schema_cache.get(num_submissions)
+        if schema is not None:
+            return schema
+
+        schema = SchemaFactory.create_object_schema(
             "vote",
             {
                 "type": "object",
@@ -105,6 +116,8 @@ class ScoreCompare(CompareVotingMethod):
                 "required": [f"submission_{i+1}" for i in range(num_submissions)],
             },
         )
+        self._schema_cache[num_submissions] = schema
+        return schema
 
     def __str__(self) -> str:
         return "Score Compare Method"
@@ -17,6 +17,8 @@ class ScoreLabel(LabelVotingMethod):
     Concrete VotingMethod class that aggregates scores assigned to individual submissions.
     """
 
+    __slots__ = ("start_value", "end_value", "increment_value")
+
     def __init__(self, start_value: int, end_value: int, increment_value: int = None):
         super().__init__()
         self.start_value = start_value
@@ -34,16 +36,16 @@ class ScoreLabel(LabelVotingMethod):
         Returns:
             Dict[str, Any]: The aggregated result of the votes.
         """
+        votes_data = voting_results.votes_data
         aggregated_results = {}
         for submission_id in submission_ids:
-            scores = [
-                vote["vote"]
-                for vote in voting_results.votes_data.get(submission_id, {}).values()
-            ]
+            votes = votes_data.get(submission_id)
+            if not votes:
+                aggregated_results[submission_id] = {"average_score": None}
+                continue
+            total = sum(vote["vote"] for vote in votes.values())
             aggregated_results[submission_id] = {
-                "average_score": (
-                    round(sum(scores) / len(scores), ROUND_NDIGITS) if scores else None
-                )
+                "average_score": round(total / len(votes), ROUND_NDIGITS)
             }
         return aggregated_results
 
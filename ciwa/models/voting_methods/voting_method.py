@@ -5,7 +5,7 @@ used in the CIWA application.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional, Tuple
 from ciwa.utils import prompt_loader
 from ciwa.models.submission import Submission
 from ciwa.models.voting_results import VotingResults
@@ -16,8 +16,25 @@ class VotingMethod(ABC):
     Abstract base class for voting methods.
     """
 
+    __slots__ = ("vote_prompt",)
+
+    # True for label voting methods, False for compare voting methods.
+    is_label: bool
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Requires every subclass to set is_label, normally by deriving from
+        LabelVotingMethod or CompareVotingMethod, which VotingManagerFactory relies on.
+        """
+        super().__init_subclass__(**kwargs)
+        if not hasattr(cls, "is_label"):
+            raise TypeError(
+                f"{cls.__name__} must subclass LabelVotingMethod or "
+                "CompareVotingMethod, or set is_label."
+            )
+
     def __init__(self) -> None:
-        self.vote_prompt = prompt_loader.get_prompts(self.__class__)["vote_prompt"]
+        self.vote_prompt = prompt_loader.get_prompts(type(self))["vote_prompt"]
 
     @property
     def type(self) -> str:
@@ -55,13 +72,6 @@ class VotingMethod(ABC):
         Returns a prompt for the vote.
         """
 
-    @staticmethod
-    @abstractmethod
-    def is_label() -> bool:
-        """
-        Returns True if the voting method is a label voting method.
-        """
-
     def __str__(self) -> str:
         return f"{self.__class__.__name__} Voting Method"
 
@@ -74,9 +84,9 @@ class LabelVotingMethod(VotingMethod, ABC):
     to each Submission.
     """
 
-    @staticmethod
-    def is_label() -> bool:
-        return True
+    __slots__ = ()
+
+    is_label = True
 
     def get_vote_prompt(self, submission: Submission, **kwargs) -> str:
         """
@@ -98,9 +108,30 @@ class CompareVotingMethod(VotingMethod, ABC):
     where votes are given on a set of Submissions by comparing them to each other.
     """
 
+    __slots__ = ("_vote_prompt_parts",)
+
+    is_label = False
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._vote_prompt_parts = self._split_vote_prompt(self.vote_prompt)
+
     @staticmethod
-    def is_label() -> bool:
-        return False
+    def _split_vote_prompt(vote_prompt: str) -> Optional[Tuple[str, str]]:
+        """
+        Splits a vote prompt around its {submissions_contents} placeholder.
+
+        Args:
+            vote_prompt (str): The vote prompt template.
+
+        Returns:
+            Optional[Tuple[str, str]]: The text before and after the placeholder, or
+                                       None if the template needs str.format.
+        """
+        parts = vote_prompt.split("{submissions_contents}")
+        if len(parts) != 2 or any("{" in part or "}" in part for part in parts):
+            return None
+        return parts[0], parts[1]
 
     def get_vote_prompt(self, submissions: List[Submission], **kwargs) -> str:
         """
@@ -111,6 +142,9 @@ class CompareVotingMethod(VotingMethod, ABC):
                 f"Submission {i + 1}:\n{submission.content}\n\n"
                 for i, submission in enumerate(submissions)
             )
+            if self._vote_prompt_parts is not None:
+                prefix, suffix = self._vote_prompt_parts
+                return prefix + submissions_contents_str + suffix
             return self.vote_prompt.format(
                 submissions_contents=submissions_contents_str, **kwargs
             )
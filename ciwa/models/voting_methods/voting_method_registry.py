@@ -39,6 +39,7 @@ def get_voting_method(voting_method_name: str) -> Type[VotingMethod]:
     Returns:
         Type[VotingMethod]: The voting method class.
     """
-    if voting_method_name not in _voting_method_registry:
+    voting_method = _voting_method_registry.get(voting_method_name)
+    if voting_method is None:
         raise ValueError(f"Voting method {voting_method_name} is not registered.")
-    return _voting_method_registry[voting_method_name]
+    return voting_method
@@ -12,5 +12,7 @@ class YesNoLabel(EnumLabel):
     Concrete VotingMethod class that applies a label vote of "yes" or "no".
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(enum_values=["yes", "no"])
@@ -6,7 +6,7 @@ LabelVotingResults and CompareVotingResults, for managing voting results.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Set
 import datetime
 
 
@@ -20,10 +20,29 @@ class VotingResults(ABC):
         aggregated_results (Dict[str, Any]): Aggregated results of all participant votes.
     """
 
+    __slots__ = (
+        "participants",
+        "votes_data",
+        "aggregated_results",
+        "_participants_set",
+    )
+
     def __init__(self) -> None:
         self.participants: List[str] = []
         self.votes_data: Dict[str, Any] = {}
         self.aggregated_results: Dict[str, Any] = {}
+        self._participants_set: Set[str] = set()
+
+    def _add_participant(self, participant_id: str) -> None:
+        """
+        Record a participant as having voted, preserving first-vote order.
+
+        Args:
+            participant_id (str): The ID of the participant who voted.
+        """
+        if participant_id not in self._participants_set:
+            self._participants_set.add(participant_id)
+            self.participants.append(participant_id)
 
     @abstractmethod
     def add_vote(self, participant_id: str, vote_data: Any) -> None:
@@ -69,6 +88,8 @@ class LabelVotingResults(VotingResults):
                 (uuid: participant UUID, vote: vote JSON)
     """
 
+    __slots__ = ("submissions",)
+
     def __init__(self) -> None:
         super().__init__()
         self.submissions: Dict[str, List[Dict[str, Any]]] = {}
@@ -81,9 +102,8 @@ class LabelVotingResults(VotingResults):
             participant_id (str): The ID of the participant who voted.
             vote_data (Dict[str, Any]): The raw vote data from the participant.
         """
-        created_at = datetime.datetime.now()
-        if participant_id not in self.participants:
-            self.participants.append(participant_id)
+        created_at = datetime.datetime.now().isoformat()
+        self._add_participant(participant_id)
         for submission_id, vote in vote_data.items():
             vote["created_at"] = created_at
             if submission_id not in self.submissions:
@@ -107,6 +127,31 @@ class LabelVotingResults(VotingResults):
         """
         self.aggregated_results = voting_method.process_votes(self, submission_ids)
 
+    def iter_submission_entries(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the JSON-compatible entry for each voted-on submission, one at a time.
+
+        Lets callers stream label voting results (e.g. into a file or response) without
+        building the full list of submission entries first.
+
+        Yields:
+            Dict[str, Any]: A submission UUID and the votes cast on it.
+        """
+        for submission_id, voting_participants in self.submissions.items():
+            yield {
+                "uuid": submission_id,
+                "voting_participants": [
+                    {
+                        "uuid": participant["uuid"],
+                        "vote": {
+                            "created_at": participant["vote"]["created_at"],
+                            "vote": participant["vote"]["vote"],
+                        },
+                    }
+                    for participant in voting_participants
+                ],
+            }
+
     def to_json(self) -> Dict[str, Any]:
         """
         Return a JSON-compatible representation of the label voting results.
@@ -115,24 +160,7 @@ class LabelVotingResults(VotingResults):
             Dict[str, Any]: JSON-compatible representation of the label voting results.
         """
         return {
-            "submissions": [
-                {
-                    "uuid": submission_id,
-                    "voting_participants": [
-                        {
-                            "uuid": participant["uuid"],
-                            "vote": {
-                                "created_at": participant["vote"][
-                                    "created_at"
-                                ].isoformat(),
-                                "vote": participant["vote"]["vote"],
-                            },
-                        }
-                        for participant in voting_participants
-                    ],
-                }
-                for submission_id, voting_participants in self.submissions.items()
-            ],
+            "submissions": list(self.iter_submission_entries()),
             "aggregated_results": {
                 "submissions": [
                     {"uuid": submission_id, "result": result}
@@ -150,6 +178,8 @@ class CompareVotingResults(VotingResults):
         submissions (List[str]): List of submission IDs voted on.
     """
 
+    __slots__ = ()
+
     def add_vote(self, participant_id: str, vote_data: Any) -> None:
         """
         Add a participant's compare vote to the results.
@@ -158,9 +188,8 @@ class CompareVotingResults(VotingResults):
             participant_id (str): The ID of the participant who voted.
             vote_data (Any): The raw vote data from the participant.
         """
-        vote_data["created_at"] = datetime.datetime.now()
-        if participant_id not in self.participants:
-            self.participants.append(participant_id)
+        vote_data["created_at"] = datetime.datetime.now().isoformat()
+        self._add_participant(participant_id)
         self.votes_data[participant_id] = vote_data
 
     def process_votes(
@@ -188,7 +217,7 @@ class CompareVotingResults(VotingResults):
                 {
                     "uuid": participant_id,
                     "vote": {
-                        "created_at": vote_data["created_at"].isoformat(),
+                        "created_at": vote_data["created_at"],
                         "vote": vote_data["vote"],
                     },
                 }
@@ -1,5 +1,23 @@
 import sys
 import os
+import pytest
+from pytest_asyncio import is_async_test
 
 # Add the project root directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+def pytest_collection_modifyitems(items):
+    # Run every async test on one session-wide event loop instead of a new loop per test.
+    session_scope_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def openai_api_key():
+    # A fake key for the whole session, so no test can reach OpenAI with a real one.
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("OPENAI_API_KEY", "test_api_key")
+        yield
@@ -21,8 +21,7 @@ class MockCompareVotingMethod(CompareVotingMethod):
 
     def process_votes(self, voting_results, submission_ids):
         # Implement a simple mock processing logic
-        results = {submission_id: 1.0 for submission_id in submission_ids}
-        return results
+        return dict.fromkeys(submission_ids, 1.0)
 
 
 @pytest.fixture
@@ -56,6 +55,15 @@ def test_compare_voting_results_add_vote(topic, participant):
     assert participant.uuid in voting_results.votes_data
 
 
+def test_compare_voting_results_add_vote_repeat_participant(topic, participant):
+    voting_results = CompareVotingResults()
+    voting_results.add_vote(participant.uuid, {"vote": ["submission_id1"]})
+    voting_results.add_vote(participant.uuid, {"vote": ["submission_id2"]})
+
+    assert voting_results.participants == [participant.uuid]
+    assert not hasattr(voting_results, "__dict__")
+
+
 def test_compare_voting_results_process_votes(topic, participant):
     voting_results = CompareVotingResults()
     voting_method = MockCompareVotingMethod()
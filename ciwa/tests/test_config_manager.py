@@ -2,6 +2,7 @@
 
 import pytest
 from ciwa.config import ConfigManager
+from ciwa.config import config_manager as config_manager_module
 
 
 def test_config_manager_init_from_file():
@@ -34,3 +35,24 @@ def test_config_manager_init_from_kwargs():
     config = config_manager.get_config("process")
     assert config["name"] == "Test Process from kwargs"
     assert config["description"] == "A test process from kwargs"
+
+
+def test_config_manager_file_configs_are_independent():
+    first = ConfigManager(config_path="ciwa/tests/config/settings.yaml")
+    second = ConfigManager(config_path="ciwa/tests/config/settings.yaml")
+    assert first.config == second.config
+    first.get_config("process").pop("sessions", None)
+    assert "sessions" in second.get_config("process")
+
+
+def test_config_manager_reloads_changed_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager_module, "_config_cache", {})
+    config_file = tmp_path / "settings.yaml"
+    config_file.write_text("process:\n  name: Before\n")
+    assert ConfigManager(config_path=str(config_file)).get_config("process.name") == (
+        "Before"
+    )
+    config_file.write_text("process:\n  name: After change\n")
+    assert ConfigManager(config_path=str(config_file)).get_config("process.name") == (
+        "After change"
+    )
@@ -1,5 +1,11 @@
+import os
+from types import MappingProxyType
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
+from autogen.oai import client as autogen_client
+from ciwa.models.participants import (
+    conversable_agent_participant as conversable_agent_participant_module,
+)
 from ciwa.models.participants.conversable_agent_participant import (
     ConversableAgentParticipant,
 )
@@ -15,50 +21,69 @@ from ciwa.tests.utils.model_utils import (
 
 
 @pytest.fixture
-def mock_openai():
-    with patch("autogen.oai.client.OpenAI") as mock_openai:
-        mock_openai.return_value = MagicMock()
-        yield mock_openai
+def mock_openai(monkeypatch):
+    mock_openai = MagicMock(return_value=MagicMock())
+    monkeypatch.setattr(autogen_client, "OpenAI", mock_openai)
+    return mock_openai
 
 
 @pytest.fixture
-def mock_file_operations(mock_openai):
-    with patch("os.path.isfile", return_value=True), patch(
-        "ciwa.models.participants.conversable_agent_participant.autogen.config_list_from_json",
-        return_value=[{"config": "test"}],
-    ), patch(
-        "ciwa.models.participants.conversable_agent_participant.autogen.filter_config",
-        return_value=[{"config": "test"}],
-    ):
-        yield
+def mock_file_operations(mock_openai, monkeypatch):
+    monkeypatch.setattr(os.path, "isfile", lambda path: True)
+    monkeypatch.setattr(
+        conversable_agent_participant_module.autogen,
+        "config_list_from_json",
+        lambda *args, **kwargs: [{"config": "test"}],
+    )
+    monkeypatch.setattr(
+        conversable_agent_participant_module.autogen,
+        "filter_config",
+        lambda *args, **kwargs: [{"config": "test"}],
+    )
 
 
-def mock_get_prompts(cls: type, yaml_file: str = "dummy_file.yaml") -> dict:
-    prompts = {
-        "LLMAgentParticipant": {
-            "system_message": "Welcome to the {process_name}. This is a {process_description}.\n{role_description}\n{current_session_message}",
-            "submission_prompt": "Please generate a submission for this topic: {topic_title}\nDescription: {topic_description}",
-            "invalid_json_response": "Invalid JSON response. Please try again.",
-            "respond_with_json": "Your response must be in JSON: {schema}",
-            "current_session_message": "Current session is {session_name}: {session_description}",
-        },
-        "ConversableAgentParticipant": {
-            "system_message": "Welcome to the {process_name}. This is a {process_description}.\n{role_description}\n{current_session_message}",
-            "submission_prompt": "Please generate a submission for this topic: {topic_title}\nDescription: {topic_description}",
-            "invalid_json_response": "Invalid JSON response. Please try again.",
-            "respond_with_json": "Your response must be in JSON: {schema}",
-            "current_session_message": "Current session is {session_name}: {session_description}",
-        },
-        "RankingCompare": {
-            "vote_prompt": "Please rank the following submissions from your most preferred to least preferred:\n\n{submissions_contents}\n\nReturn the rankings as a list of submission numbers, where the first item is your top preference and the last item is your least preferred."
-        },
+CONTENT_SCHEMA = {
+    "type": "object",
+    "properties": {"content": {"type": "string"}},
+    "required": ["content"],
+    "additionalProperties": False,
+}
+
+MOCK_PROMPTS = MappingProxyType(
+    {
+        "LLMAgentParticipant": MappingProxyType(
+            {
+                "system_message": "Welcome to the {process_name}. This is a {process_description}.\n{role_description}\n{current_session_message}",
+                "submission_prompt": "Please generate a submission for this topic: {topic_title}\nDescription: {topic_description}",
+                "invalid_json_response": "Invalid JSON response. Please try again.",
+                "respond_with_json": "Your response must be in JSON: {schema}",
+                "current_session_message": "Current session is {session_name}: {session_description}",
+            }
+        ),
+        "ConversableAgentParticipant": MappingProxyType(
+            {
+                "system_message": "Welcome to the {process_name}. This is a {process_description}.\n{role_description}\n{current_session_message}",
+                "submission_prompt": "Please generate a submission for this topic: {topic_title}\nDescription: {topic_description}",
+                "invalid_json_response": "Invalid JSON response. Please try again.",
+                "respond_with_json": "Your response must be in JSON: {schema}",
+                "current_session_message": "Current session is {session_name}: {session_description}",
+            }
+        ),
+        "RankingCompare": MappingProxyType(
+            {
+                "vote_prompt": "Please rank the following submissions from your most preferred to least preferred:\n\n{submissions_contents}\n\nReturn the rankings as a list of submission numbers, where the first item is your top preference and the last item is your least preferred."
+            }
+        ),
     }
+)
+EMPTY_PROMPTS = MappingProxyType({})
 
-    class_name = cls.__name__
-    return prompts.get(class_name, {})
 
+def mock_get_prompts(cls: type, yaml_file: str = "dummy_file.yaml") -> dict:
+    return MOCK_PROMPTS.get(cls.__name__, EMPTY_PROMPTS)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_prompt_loader():
     with patch("ciwa.utils.prompt_loader.get_prompts", side_effect=mock_get_prompts):
         yield
@@ -88,7 +113,6 @@ def test_initialization(conversable_agent_participant):
     "ciwa.models.participants.conversable_agent_participant.autogen.config_list_from_json"
 )
 @patch("ciwa.models.participants.conversable_agent_participant.autogen.filter_config")
-@patch.dict("os.environ", {"OPENAI_API_KEY": "test_api_key"})
 def test_init_agent(
     mock_filter_config,
     mock_config_list_from_json,
@@ -112,34 +136,27 @@ def test_load_config_list(conversable_agent_participant):
 
 
 @pytest.mark.asyncio
-async def test_send_prompt(conversable_agent_participant):
-    with patch.object(
-        conversable_agent_participant.agent, "a_generate_reply", new_callable=AsyncMock
-    ) as mock_generate_reply:
-        mock_generate_reply.return_value = "Test reply"
-        schema = {
-            "type": "object",
-            "properties": {"content": {"type": "string"}},
-            "required": ["content"],
-            "additionalProperties": False,
-        }
-
-        response = await conversable_agent_participant.send_prompt(
-            "Test prompt", schema
-        )
-        assert response == "Test reply"
-        mock_generate_reply.assert_called_once()
+async def test_send_prompt(conversable_agent_participant, monkeypatch):
+    mock_generate_reply = AsyncMock(return_value="Test reply")
+    monkeypatch.setattr(
+        conversable_agent_participant.agent, "a_generate_reply", mock_generate_reply
+    )
+    schema = CONTENT_SCHEMA
+
+    response = await conversable_agent_participant.send_prompt("Test prompt", schema)
+    assert response == "Test reply"
+    mock_generate_reply.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_create_submission(
-    conversable_agent_participant, topic, mock_prompt_loader
+    conversable_agent_participant, topic, mock_prompt_loader, monkeypatch
 ):
-    with patch.object(
+    monkeypatch.setattr(
         conversable_agent_participant,
         "send_prompt_with_retries",
-        return_value={"submission": {"content": "Test content"}},
-    ):
-        submission = await conversable_agent_participant.create_submission(topic)
-        assert submission is not None
-        assert submission.content == "Test content"
+        AsyncMock(return_value={"submission": {"content": "Test content"}}),
+    )
+    submission = await conversable_agent_participant.create_submission(topic)
+    assert submission is not None
+    assert submission.content == "Test content"
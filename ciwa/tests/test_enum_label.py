@@ -5,12 +5,12 @@ from ciwa.models.voting_methods import EnumLabel
 from ciwa.models.voting_results import LabelVotingResults
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def enum_labels():
     return ["Option1", "Option2", "Option3"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def enum_label_voting_method(enum_labels):
     return EnumLabel(enum_values=enum_labels)
 
@@ -22,6 +22,8 @@ def test_enum_label_voting_method_initialization(enum_label_voting_method):
 def test_enum_label_voting_method_get_vote_schema(enum_label_voting_method):
     schema = enum_label_voting_method.get_vote_schema()
     assert isinstance(schema, dict)
+    assert schema["properties"]["vote"]["enum"] == ["Option1", "Option2", "Option3"]
+    assert enum_label_voting_method.get_vote_schema() is schema
 
 
 def test_enum_label_voting_method_process_votes(enum_label_voting_method):
@@ -45,3 +47,11 @@ def test_enum_label_voting_method_process_votes(enum_label_voting_method):
     results = enum_label_voting_method.process_votes(voting_results, submission_ids)
     assert results["submission1"] == {"Option1": 2, "Option2": 1, "Option3": 0}
     assert results["submission2"] == {"Option1": 0, "Option2": 1, "Option3": 0}
+
+
+def test_enum_label_voting_method_rejects_unknown_vote(enum_label_voting_method):
+    voting_results = LabelVotingResults()
+    voting_results.add_vote("participant1", {"submission1": {"vote": "Option4"}})
+
+    with pytest.raises(KeyError, match="Option4"):
+        enum_label_voting_method.process_votes(voting_results, ["submission1"])
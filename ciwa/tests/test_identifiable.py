@@ -8,6 +8,8 @@ def test_identifiable_initialization():
     identifiable = Identifiable()
     assert identifiable.uuid is not None
     assert isinstance(identifiable.uuid, str)
+    assert identifiable.uuid == identifiable.uuid
+    assert Identifiable().uuid != identifiable.uuid
 
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+# tests/test_json_utils.py
+
+import math
+import jsonschema
+import pytest
+from ciwa.utils import json_utils
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"content": {"type": "string"}},
+    "required": ["content"],
+}
+
+
+def test_get_validator_is_cached_by_content():
+    validator = json_utils.get_validator(SCHEMA)
+    # An equal schema built with a different key order reuses the same validator.
+    reordered = {key: SCHEMA[key] for key in reversed(list(SCHEMA))}
+    assert json_utils.get_validator(reordered) is validator
+
+
+def test_get_validator_validates_instances():
+    validator = json_utils.get_validator(SCHEMA)
+    validator.validate({"content": "text"})
+    with pytest.raises(jsonschema.ValidationError):
+        validator.validate({"content": 1})
+    assert json_utils.is_valid_json_for_schema({"content": "text"}, SCHEMA)
+    assert not json_utils.is_valid_json_for_schema({}, SCHEMA)
+
+
+def test_is_valid_json_for_schema_ignores_defaults_and_formats():
+    default_schema = {
+        "type": "object",
+        "properties": {"a": {"type": "integer", "default": 5}},
+    }
+    format_schema = {
+        "type": "object",
+        "properties": {"email": {"type": "string", "format": "email"}},
+    }
+
+    data = {}
+    assert json_utils.is_valid_json_for_schema(data, default_schema)
+    # Defaults are never written into the validated data.
+    assert data == {}
+    # Formats are annotations only, as with jsonschema's default validator.
+    assert json_utils.is_valid_json_for_schema({"email": "notanemail"}, format_schema)
+
+
+def test_validate_schema_rejects_invalid_schema_every_time():
+    # Failures are not cached, so a bad schema raises on each call.
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            json_utils.validate_schema({"type": "invalid_type"})
+    json_utils.validate_schema(SCHEMA)
+
+
+def test_is_valid_json_for_schema_rejects_invalid_schema():
+    with pytest.raises(jsonschema.SchemaError):
+        json_utils.is_valid_json_for_schema({}, {"type": "invalid_type"})
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('Here you go:\n```json\n{"vote": [1, 2]}\n```', '{"vote": [1, 2]}'),
+        ('My vote is {"vote": {"a": 1}} as requested.', '{"vote": {"a": 1}}'),
+        ('Skip {not json} then {"vote": "yes"}', '{"vote": "yes"}'),
+        ('Stray } before {"vote": "no"}', '{"vote": "no"}'),
+        ("No JSON here.", ""),
+    ],
+)
+def test_extract_json(text, expected):
+    assert json_utils.extract_json(text) == expected
+
+
+def test_extract_json_schema_from_prompt():
+    schema = json_utils.SchemaFactory.create_object_schema("content", SCHEMA)
+    prompt = (
+        'Earlier text with {"not": "a schema"}.\n'
+        f"Respond with JSON matching:\n{json_utils.get_json_string(schema)}\n"
+        "Don't add anything after the closing } brace."
+    )
+    assert json_utils.extract_json_schema(prompt) == schema
+
+
+def test_extract_json_schema_returns_none_without_schema():
+    assert json_utils.extract_json_schema('No schema in {"vote": 1}') is None
+
+
+def test_generate_random_text():
+    text = json_utils.generate_random_text(length=25)
+    assert len(text) == 25
+    assert text.isalpha() and text.islower()
+    assert json_utils.generate_random_text(length=0) == ""
+
+
+def test_get_json_logs_invalid_input(caplog):
+    assert json_utils.get_json('{"vote": 1}') == {"vote": 1}
+    assert json_utils.get_json({"vote": 1}) == {"vote": 1}
+    assert json_utils.get_json("not json") is None
+    assert json_utils.get_json(42) is None
+    assert "JSON decode error" in caplog.text
+    assert "Invalid input type" in caplog.text
+
+
+def test_get_json_accepts_non_finite_and_big_numbers():
+    assert math.isnan(json_utils.get_json('{"a": NaN}')["a"])
+    assert json_utils.get_json('{"a": Infinity}') == {"a": float("inf")}
+    assert json_utils.get_json('{"a": 18446744073709551616}') == {"a": 2**64}
+
+
+def test_generate_fake_json_unique_items_respects_bounds():
+    schema = {
+        "type": "object",
+        "properties": {
+            "vote": {
+                "type": "array",
+                "items": {"type": "integer", "minimum": 1, "maximum": 10},
+                "minItems": 2,
+                "maxItems": 4,
+                "uniqueItems": True,
+            }
+        },
+    }
+    for _ in range(20):
+        vote = json_utils.generate_fake_json(schema)["vote"]
+        assert 2 <= len(vote) <= 4
+        assert len(set(vote)) == len(vote)
+        assert all(1 <= value <= 10 for value in vote)
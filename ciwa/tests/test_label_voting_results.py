@@ -1,5 +1,6 @@
 # ciwa/tests/test_label_voting_results.py
 
+import json
 import pytest
 from ciwa.models.voting_results import LabelVotingResults
 from ciwa.models.voting_methods import LabelVotingMethod
@@ -22,8 +23,7 @@ class MockLabelVotingMethod(LabelVotingMethod):
 
     def process_votes(self, voting_results, submission_ids):
         # Implement a simple mock processing logic
-        results = {submission_id: 1.0 for submission_id in submission_ids}
-        return results
+        return dict.fromkeys(submission_ids, 1.0)
 
 
 @pytest.fixture
@@ -84,6 +84,19 @@ def test_label_voting_results_to_json(topic, participant):
 
     assert "submissions" in json_data
     assert "aggregated_results" in json_data
+    # created_at is stored pre-formatted, so the output needs no custom encoder
+    assert json.loads(json.dumps(json_data)) == json_data
+
+
+def test_label_voting_results_iter_submission_entries(topic, participant):
+    voting_results = LabelVotingResults()
+    voting_results.add_vote(participant.uuid, {"submission_id": {"vote": "yes"}})
+
+    entries = list(voting_results.iter_submission_entries())
+
+    assert entries == voting_results.to_json()["submissions"]
+    assert entries[0]["uuid"] == "submission_id"
+    assert entries[0]["voting_participants"][0]["uuid"] == participant.uuid
 
 
 if __name__ == "__main__":
@@ -1,16 +1,21 @@
 # ciwa/tests/test_process.py
 
+import copy
 import pytest
 from ciwa.config import ConfigManager
 from ciwa.models.process import ProcessFactory
 from ciwa.models.owner import Owner
 
 
-@pytest.fixture
-def process():
+@pytest.fixture(scope="module")
+def process_config():
     config_manager = ConfigManager(config_path="ciwa/tests/config/settings.yaml")
-    process_config = config_manager.get_config("process")
-    return ProcessFactory.create_process(config=process_config)
+    return config_manager.get_config("process")
+
+
+@pytest.fixture
+def process(process_config):
+    return ProcessFactory.create_process(config=copy.deepcopy(process_config))
 
 
 def test_process_creation(process):
@@ -5,7 +5,7 @@ from ciwa.models.process import ProcessFactory
 from ciwa.config import ConfigManager
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def process_config():
     return {
         "name": "Test Process",
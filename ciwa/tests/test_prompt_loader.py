@@ -3,10 +3,19 @@
 import pytest
 from unittest.mock import patch, mock_open
 import yaml
-from ciwa.utils.prompt_loader import load_prompts, get_prompts
+from ciwa.utils import prompt_loader
+from ciwa.utils.prompt_loader import load_prompts, get_prompts, clear_prompts_cache
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # The mocked files share paths with the real prompts file, so keep them out of the cache.
+    clear_prompts_cache()
+    yield
+    clear_prompts_cache()
+
+
+@pytest.fixture(scope="module")
 def mock_yaml_content():
     return """
     BaseClass:
@@ -26,6 +35,18 @@ def mock_file(mock_yaml_content):
     return mock_open(read_data=mock_yaml_content)
 
 
+@pytest.fixture(scope="module")
+def parsed_prompts(mock_yaml_content):
+    return yaml.safe_load(mock_yaml_content)
+
+
+@pytest.fixture
+def patched_load(parsed_prompts, monkeypatch):
+    monkeypatch.setattr(
+        prompt_loader, "_load_prompts_cached", lambda yaml_file: parsed_prompts
+    )
+
+
 def test_load_prompts(mock_file):
     with patch("builtins.open", mock_file), patch("os.path.exists", return_value=True):
         prompts = load_prompts("dummy_path.yaml")
@@ -38,12 +59,11 @@ def test_load_prompts(mock_file):
     assert prompts["StandaloneClass"]["custom_prompt"] == "Standalone custom prompt"
 
 
-def test_get_prompts_base_class(mock_file):
+def test_get_prompts_base_class(patched_load):
     class BaseClass:
         pass
 
-    with patch("builtins.open", mock_file), patch("os.path.exists", return_value=True):
-        prompts = get_prompts(BaseClass)
+    prompts = get_prompts(BaseClass)
 
     assert "system_message" in prompts
     assert "submission_prompt" in prompts
@@ -51,15 +71,14 @@ def test_get_prompts_base_class(mock_file):
     assert prompts["submission_prompt"] == "Base submission prompt"
 
 
-def test_get_prompts_derived_class(mock_file):
+def test_get_prompts_derived_class(patched_load):
     class BaseClass:
         pass
 
     class DerivedClass(BaseClass):
         pass
 
-    with patch("builtins.open", mock_file), patch("os.path.exists", return_value=True):
-        prompts = get_prompts(DerivedClass)
+    prompts = get_prompts(DerivedClass)
 
     assert "system_message" in prompts
     assert "submission_prompt" in prompts
@@ -67,23 +86,21 @@ def test_get_prompts_derived_class(mock_file):
     assert prompts["submission_prompt"] == "Derived submission prompt"
 
 
-def test_get_prompts_standalone_class(mock_file):
+def test_get_prompts_standalone_class(patched_load):
     class StandaloneClass:
         pass
 
-    with patch("builtins.open", mock_file), patch("os.path.exists", return_value=True):
-        prompts = get_prompts(StandaloneClass)
+    prompts = get_prompts(StandaloneClass)
 
     assert "custom_prompt" in prompts
     assert prompts["custom_prompt"] == "Standalone custom prompt"
 
 
-def test_get_prompts_nonexistent_class(mock_file):
+def test_get_prompts_nonexistent_class(patched_load):
     class NonexistentClass:
         pass
 
-    with patch("builtins.open", mock_file), patch("os.path.exists", return_value=True):
-        prompts = get_prompts(NonexistentClass)
+    prompts = get_prompts(NonexistentClass)
 
     assert prompts == {}
 
@@ -94,7 +111,7 @@ def test_load_prompts_file_not_found():
             load_prompts("nonexistent_file.yaml")
 
 
-def test_get_prompts_inheritance_order(mock_file):
+def test_get_prompts_inheritance_order(monkeypatch):
     class GrandparentClass:
         pass
 
@@ -118,12 +135,44 @@ def test_get_prompts_inheritance_order(mock_file):
         prompt4: "Child prompt 4"
     """
 
-    with patch("builtins.open", mock_open(read_data=mock_yaml_content)), patch(
-        "os.path.exists", return_value=True
-    ):
-        prompts = get_prompts(ChildClass)
+    parsed_prompts = yaml.safe_load(mock_yaml_content)
+    monkeypatch.setattr(
+        prompt_loader, "_load_prompts_cached", lambda yaml_file: parsed_prompts
+    )
+    prompts = get_prompts(ChildClass)
 
     assert prompts["prompt1"] == "Grandparent prompt 1"
     assert prompts["prompt2"] == "Parent prompt 2"
     assert prompts["prompt3"] == "Child prompt 3"
     assert prompts["prompt4"] == "Child prompt 4"
+
+
+def test_load_prompts_cached_until_file_changes(tmp_path):
+    yaml_file = tmp_path / "prompts.yaml"
+    yaml_file.write_text('BaseClass:\n  system_message: "First"\n')
+
+    prompts = load_prompts(str(yaml_file))
+    prompts["BaseClass"]["system_message"] = "Mutated"
+    assert load_prompts(str(yaml_file))["BaseClass"]["system_message"] == "First"
+
+    yaml_file.write_text('BaseClass:\n  system_message: "Second message"\n')
+    assert load_prompts(str(yaml_file))["BaseClass"]["system_message"] == (
+        "Second message"
+    )
+
+
+def test_get_prompts_cached_per_class(tmp_path):
+    class BaseClass:
+        pass
+
+    yaml_file = tmp_path / "prompts.yaml"
+    yaml_file.write_text('BaseClass:\n  system_message: "First"\n')
+
+    prompts = get_prompts(BaseClass, str(yaml_file))
+    prompts["system_message"] = "Mutated"
+    assert get_prompts(BaseClass, str(yaml_file)) == {"system_message": "First"}
+
+    yaml_file.write_text('BaseClass:\n  system_message: "Second message"\n')
+    assert get_prompts(BaseClass, str(yaml_file)) == {
+        "system_message": "Second message"
+    }
@@ -11,6 +11,16 @@ def ranking_compare_voting_method():
     return RankingCompare()
 
 
+@pytest.fixture(scope="module")
+def submission_ids():
+    return ["submission1", "submission2", "submission3"]
+
+
+@pytest.fixture(scope="module")
+def submissions(submission_ids):
+    return [create_submission(id=id) for id in submission_ids]
+
+
 def test_ranking_compare_voting_method_initialization(ranking_compare_voting_method):
     assert ranking_compare_voting_method is not None
 
@@ -18,12 +28,15 @@ def test_ranking_compare_voting_method_initialization(ranking_compare_voting_met
 def test_ranking_compare_voting_method_get_vote_schema(ranking_compare_voting_method):
     schema = ranking_compare_voting_method.get_vote_schema(num_submissions=3)
     assert isinstance(schema, dict)
+    assert ranking_compare_voting_method.get_vote_schema(num_submissions=3) is schema
+    other = ranking_compare_voting_method.get_vote_schema(num_submissions=4)
+    assert other["properties"]["vote"]["maxItems"] == 4
 
 
-def test_ranking_compare_voting_method_process_votes(ranking_compare_voting_method):
+def test_ranking_compare_voting_method_process_votes(
+    ranking_compare_voting_method, submissions, submission_ids
+):
     voting_results = CompareVotingResults()
-    submission_ids = ["submission1", "submission2", "submission3"]
-    submissions = [create_submission(id=id) for id in submission_ids]
     ranking_compare_voting_method.get_vote_prompt(submissions)
 
     votes = {
@@ -43,3 +56,16 @@ def test_ranking_compare_voting_method_process_votes(ranking_compare_voting_meth
     assert "submission1" in results
     assert "submission2" in results
     assert results == {"submission2": 0.667, "submission1": 1.0, "submission3": 1.333}
+
+
+def test_ranking_compare_voting_method_get_vote_prompt(ranking_compare_voting_method):
+    submissions = [
+        create_submission(id="submission1", content="First {content}"),
+        create_submission(id="submission2", content="Second"),
+    ]
+    prompt = ranking_compare_voting_method.get_vote_prompt(submissions)
+
+    expected = ranking_compare_voting_method.vote_prompt.format(
+        submissions_contents="Submission 1:\nFirst {content}\n\nSubmission 2:\nSecond\n\n"
+    )
+    assert prompt == expected
@@ -11,6 +11,16 @@ def score_compare_voting_method():
     return ScoreCompare(start_value=1, end_value=10)
 
 
+@pytest.fixture(scope="module")
+def submission_ids():
+    return ["submission1", "submission2"]
+
+
+@pytest.fixture(scope="module")
+def submissions(submission_ids):
+    return [create_submission(id=id) for id in submission_ids]
+
+
 def test_score_compare_voting_method_initialization(score_compare_voting_method):
     assert score_compare_voting_method is not None
 
@@ -20,10 +30,10 @@ def test_score_compare_voting_method_get_vote_schema(score_compare_voting_method
     assert isinstance(schema, dict)
 
 
-def test_score_compare_voting_method_process_votes(score_compare_voting_method):
+def test_score_compare_voting_method_process_votes(
+    score_compare_voting_method, submissions, submission_ids
+):
     voting_results = CompareVotingResults()
-    submission_ids = ["submission1", "submission2"]
-    submissions = [create_submission(id=id) for id in submission_ids]
     score_compare_voting_method.get_vote_prompt(submissions)
 
     votes = {
@@ -5,7 +5,7 @@ from ciwa.models.voting_methods import ScoreLabel
 from ciwa.models.voting_results import LabelVotingResults
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def score_label_voting_method():
     return ScoreLabel(start_value=1, end_value=10)
 
@@ -39,3 +39,14 @@ def test_score_label_voting_method_process_votes(score_label_voting_method):
     results = score_label_voting_method.process_votes(voting_results, submission_ids)
     assert results["submission1"]["average_score"] == 4.5
     assert results["submission2"]["average_score"] == 3
+
+
+def test_score_label_voting_method_process_votes_no_votes(score_label_voting_method):
+    voting_results = LabelVotingResults()
+    voting_results.add_vote("participant1", {"submission1": {"vote": 7}})
+
+    results = score_label_voting_method.process_votes(
+        voting_results, ["submission1", "submission2"]
+    )
+    assert results["submission1"]["average_score"] == 7
+    assert results["submission2"]["average_score"] is None
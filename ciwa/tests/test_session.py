@@ -14,7 +14,7 @@ def process():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def session_config():
     return {
         "name": "Test Session",
@@ -1,16 +1,18 @@
 # tests/test_session_parser.py
 
+import copy
+import io
+from collections import OrderedDict
 import pytest
 import json
-import pandas as pd
-from pathlib import Path
-from tempfile import NamedTemporaryFile
+from ciwa.utils import session_parser
 from ciwa.utils.session_parser import (
+    get_most_recent_session_file,
     parse_session_json,
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_session_data():
     return {
         "session": {
@@ -61,39 +63,38 @@ def sample_session_data():
 
 @pytest.fixture
 def sample_session_file(sample_session_data):
-    with NamedTemporaryFile(mode="w", delete=False, suffix=".json") as temp_file:
-        json.dump(sample_session_data, temp_file)
-    yield temp_file.name
-    Path(temp_file.name).unlink()
+    return io.StringIO(json.dumps(sample_session_data))
 
 
 def test_parse_session_json_with_dict(sample_session_data):
-    tables = parse_session_json(sample_session_data)
+    tables = parse_session_json(sample_session_data, as_dataframes=False)
 
     assert "participants" in tables
     assert "topics" in tables
     assert "submissions" in tables
     assert "votes" in tables
 
-    assert isinstance(tables["participants"], pd.DataFrame)
-    assert isinstance(tables["topics"], pd.DataFrame)
-    assert isinstance(tables["submissions"], pd.DataFrame)
-    assert isinstance(tables["votes"], pd.DataFrame)
+    assert isinstance(tables["participants"], list)
+    assert isinstance(tables["topics"], list)
+    assert isinstance(tables["submissions"], list)
+    assert isinstance(tables["votes"], list)
 
     assert len(tables["participants"]) == 1
     assert len(tables["topics"]) == 1
     assert len(tables["submissions"]) == 1
     assert len(tables["votes"]) == 1
 
-    assert tables["participants"].iloc[0]["uuid"] == "test-participant-uuid"
-    assert tables["topics"].iloc[0]["uuid"] == "test-topic-uuid"
-    assert tables["submissions"].iloc[0]["uuid"] == "test-submission-uuid"
-    assert tables["votes"].iloc[0]["participant_uuid"] == "test-participant-uuid"
+    assert tables["participants"][0]["uuid"] == "test-participant-uuid"
+    assert tables["topics"][0]["uuid"] == "test-topic-uuid"
+    assert tables["submissions"][0]["uuid"] == "test-submission-uuid"
+    assert tables["votes"][0]["participant_uuid"] == "test-participant-uuid"
 
-    assert tables["submissions"].iloc[0]["aggregated_result"] == pytest.approx(2.5)
+    assert tables["submissions"][0]["aggregated_result"] == pytest.approx(2.5)
 
 
 def test_parse_session_json_with_file(sample_session_file):
+    import pandas as pd
+
     tables = parse_session_json(sample_session_file)
 
     assert "participants" in tables
@@ -111,6 +112,82 @@ def test_parse_session_json_with_file(sample_session_file):
     assert len(tables["submissions"]) == 1
     assert len(tables["votes"]) == 1
 
+    assert list(tables["submissions"].columns) == [
+        "uuid",
+        "topic_uuid",
+        "participant_uuid",
+        "content",
+        "created_at",
+        "aggregated_result",
+    ]
+    assert tables["submissions"]["aggregated_result"].iloc[0] == pytest.approx(2.5)
+
+    assert isinstance(tables["submissions"]["topic_uuid"].dtype, pd.CategoricalDtype)
+    assert isinstance(tables["votes"]["participant_uuid"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_any_dtype(tables["submissions"]["created_at"])
+    assert pd.api.types.is_datetime64_any_dtype(tables["votes"]["created_at"])
+
+
+def test_parse_session_json_does_not_mutate_input(sample_session_data):
+    # sample_session_data is session-scoped, so parsing must leave it untouched.
+    original = copy.deepcopy(sample_session_data)
+    tables = parse_session_json(sample_session_data, as_dataframes=False)
+    assert sample_session_data == original
+    # Nor may editing the returned records change the input.
+    for table in tables.values():
+        table[0]["uuid"] = "changed"
+    assert sample_session_data == original
+
+
+def test_parse_session_json_file_is_cached_until_changed(sample_session_data, tmp_path):
+    session_file = tmp_path / "Session_test_results.json"
+    session_file.write_text(json.dumps(sample_session_data))
+
+    first = parse_session_json(session_file, as_dataframes=False)
+    first["topics"][0]["title"] = "Changed by caller"
+    second = parse_session_json(str(session_file), as_dataframes=False)
+    assert second["topics"][0]["title"] == "Test Topic"
+
+    changed = copy.deepcopy(sample_session_data)
+    changed["topics"][0]["title"] = "Updated Topic"
+    session_file.write_text(json.dumps(changed))
+    third = parse_session_json(session_file, as_dataframes=False)
+    assert third["topics"][0]["title"] == "Updated Topic"
+
+
+def test_parse_session_json_file_cache_evicts_least_recently_used(
+    sample_session_data, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(session_parser, "_SESSION_TABLES_CACHE_SIZE", 2)
+    monkeypatch.setattr(session_parser, "_session_tables_cache", OrderedDict())
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"Session_{name}_results.json"
+        path.write_text(json.dumps(sample_session_data))
+        paths.append(str(path))
+
+    parse_session_json(paths[0], as_dataframes=False)
+    parse_session_json(paths[1], as_dataframes=False)
+    # Using the first file again makes the second the least recently used.
+    parse_session_json(paths[0], as_dataframes=False)
+    parse_session_json(paths[2], as_dataframes=False)
+
+    assert list(session_parser._session_tables_cache) == [
+        (paths[0], False),
+        (paths[2], False),
+    ]
+
+
+def test_get_most_recent_session_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "unrelated.json").write_text("{}")
+    (tmp_path / "Session_dir_results.json").mkdir()
+    with pytest.raises(FileNotFoundError):
+        get_most_recent_session_file()
+
+    (tmp_path / "Session_test_results.json").write_text("{}")
+    assert get_most_recent_session_file() == "Session_test_results.json"
+
 
 def test_invalid_input():
     with pytest.raises(ValueError):
@@ -3,11 +3,10 @@ from ciwa.models.topic import TopicFactory, Topic
 from ciwa.models.session import Session
 from ciwa.models.submission import Submission
 from ciwa.models.participants import ParticipantFactory
-from unittest.mock import MagicMock
 from ciwa.models.process import Process
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def process():
     return Process(
         name="Test Process",
@@ -15,7 +14,7 @@ def process():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def session(process):
     return Session(
         process=process,
@@ -27,7 +26,7 @@ def session(process):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def topic_config():
     return {
         "title": "Test Topic",
@@ -42,16 +41,32 @@ def participant(process):
     return ParticipantFactory.create_participant(process=process, **participant_config)
 
 
-def test_topic_creation(session, topic_config):
+@pytest.fixture(scope="module")
+def shared_topic(session, topic_config):
+    # Only for tests that never mutate the topic.
+    return TopicFactory.create_topic(session=session, **topic_config)
+
+
+@pytest.fixture
+def topic(session, topic_config):
+    return TopicFactory.create_topic(session=session, **topic_config)
+
+
+def test_topic_creation(shared_topic):
+    assert shared_topic.title == "Test Topic"
+    assert shared_topic.description == "A test topic"
+    assert shared_topic.voting_manager.voting_method.type == "RankingCompare"
+
+
+def test_topic_creation_does_not_mutate_config(session, topic_config):
+    TopicFactory.create_topic(session=session, **topic_config)
+    assert topic_config["voting_method"] == {"type": "RankingCompare"}
     topic = TopicFactory.create_topic(session=session, **topic_config)
-    assert topic.title == "Test Topic"
-    assert topic.description == "A test topic"
     assert topic.voting_manager.voting_method.type == "RankingCompare"
 
 
 @pytest.mark.asyncio
-async def test_add_submission(session, topic_config, participant):
-    topic = TopicFactory.create_topic(session=session, **topic_config)
+async def test_add_submission(topic, participant):
     submission_content = "This is a test submission."
     submission = Submission(
         topic=topic, participant=participant, content=submission_content
@@ -66,8 +81,11 @@ async def test_add_submission(session, topic_config, participant):
 @pytest.mark.asyncio
 async def test_add_invalid_submission(session, topic_config, participant):
     # Topic adds submissions even if they don't pass validator.
-    topic_config["submission_validator"] = MagicMock(return_value=False)
-    topic_config["submission_invalid_message"] = "Invalid submission."
+    topic_config = {
+        **topic_config,
+        "submission_validator": lambda submission: False,
+        "submission_invalid_message": "Invalid submission.",
+    }
 
     topic = TopicFactory.create_topic(session=session, **topic_config)
 
@@ -80,14 +98,12 @@ async def test_add_invalid_submission(session, topic_config, participant):
     assert len(topic.submissions) == 1
 
 
-def test_voting_manager_initialization(session, topic_config):
-    topic = TopicFactory.create_topic(session=session, **topic_config)
-    assert topic.voting_manager is not None
-    assert topic.voting_manager.topic == topic
+def test_voting_manager_initialization(shared_topic):
+    assert shared_topic.voting_manager is not None
+    assert shared_topic.voting_manager.topic == shared_topic
 
 
-def test_set_submission_content_schema(session, topic_config):
-    topic = TopicFactory.create_topic(session=session, **topic_config)
+def test_set_submission_content_schema(topic):
     new_schema = {
         "type": "object",
         "properties": {"content": {"type": "string"}},
@@ -97,16 +113,14 @@ def test_set_submission_content_schema(session, topic_config):
     assert topic.submission_content_schema == new_schema
 
 
-def test_set_invalid_submission_content_schema(session, topic_config):
-    topic = TopicFactory.create_topic(session=session, **topic_config)
+def test_set_invalid_submission_content_schema(topic):
     invalid_schema = {"type": "invalid_type"}
     with pytest.raises(Exception):
         topic.set_submission_content_schema(invalid_schema)
 
 
 @pytest.mark.asyncio
-async def test_add_submission_with_content_schema(session, topic_config, participant):
-    topic = TopicFactory.create_topic(session=session, **topic_config)
+async def test_add_submission_with_content_schema(topic, participant):
     topic.set_submission_content_schema({"type": "string"})
 
     submission_content = "This is a test submission."
@@ -121,15 +135,14 @@ async def test_add_submission_with_content_schema(session, topic_config, partici
     assert topic.submissions[0].topic == topic
 
 
-def test_topic_to_json(session, topic_config):
-    topic = TopicFactory.create_topic(session=session, **topic_config)
-    topic_json = topic.to_json()
-    assert topic_json["uuid"] == str(topic.uuid)
-    assert topic_json["title"] == topic.title
-    assert topic_json["description"] == topic.description
+def test_topic_to_json(shared_topic):
+    topic_json = shared_topic.to_json()
+    assert topic_json["uuid"] == str(shared_topic.uuid)
+    assert topic_json["title"] == shared_topic.title
+    assert topic_json["description"] == shared_topic.description
     assert (
         topic_json["voting_method"]
-        == topic.voting_manager.voting_method.__class__.__name__
+        == shared_topic.voting_manager.voting_method.__class__.__name__
     )
     assert "submissions" in topic_json
 
@@ -1,15 +1,20 @@
 # ciwa/tests/test_voting_manager.py
 
 import pytest
-from ciwa.models.voting_manager import VotingManagerFactory
+from ciwa.models.voting_manager import (
+    VotingManagerFactory,
+    LabelVotingManager,
+    CompareVotingManager,
+)
 from ciwa.models.topic import TopicFactory
 from ciwa.models.session import Session
 from ciwa.models.submission import Submission
 from ciwa.models.participants import ParticipantFactory
 from ciwa.models.process import Process
+from ciwa.models.voting_methods.voting_method import VotingMethod
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def process():
     return Process(
         name="Test Process",
@@ -17,7 +22,7 @@ def process():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def session(process):
     return Session(
         process=process,
@@ -40,7 +45,7 @@ def topic(session):
 
 
 @pytest.fixture
-def participant():
+def participant(process):
     participant_config = {"type": "LLMAgentParticipant", "model": "gpt-3.5-turbo"}
     return ParticipantFactory.create_participant(process=process, **participant_config)
 
@@ -70,5 +75,26 @@ async def test_add_submission_to_voting_manager(topic, participant):
     assert voting_manager.topic.submissions[0].participant == participant
 
 
+@pytest.mark.asyncio
+async def test_voting_manager_factory_selects_manager_type(topic):
+    label_manager = VotingManagerFactory.create_voting_manager(
+        voting_method="YesNoLabel", topic=topic
+    )
+    compare_manager = VotingManagerFactory.create_voting_manager(
+        voting_method="RankingCompare", topic=topic
+    )
+    assert isinstance(label_manager, LabelVotingManager)
+    assert isinstance(compare_manager, CompareVotingManager)
+
+
+def test_voting_method_subclass_must_set_is_label():
+    # VotingManagerFactory picks the manager from is_label, so a subclass without it
+    # fails when defined instead of when a manager is created.
+    with pytest.raises(TypeError, match="is_label"):
+
+        class UnlabelledVotingMethod(VotingMethod):
+            pass
+
+
 if __name__ == "__main__":
     pytest.main()
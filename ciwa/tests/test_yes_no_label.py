@@ -5,7 +5,7 @@ from ciwa.models.voting_methods import YesNoLabel
 from ciwa.models.voting_results import LabelVotingResults
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def yes_no_label_voting_method():
     return YesNoLabel()
 
@@ -40,3 +40,13 @@ def test_yes_no_label_voting_method_process_votes(yes_no_label_voting_method):
     results = yes_no_label_voting_method.process_votes(voting_results, submission_ids)
     assert results["submission1"] == {"yes": 2, "no": 1}
     assert results["submission2"] == {"no": 1, "yes": 0}
+
+
+def test_yes_no_label_voting_method_process_votes_no_votes(yes_no_label_voting_method):
+    voting_results = LabelVotingResults()
+    submission_ids = ["submission1", "submission2"]
+    voting_results.add_vote("participant1", {"submission1": {"vote": "yes"}})
+
+    results = yes_no_label_voting_method.process_votes(voting_results, submission_ids)
+    assert results["submission1"] == {"yes": 1, "no": 0}
+    assert results["submission2"] == {"yes": 0, "no": 0}
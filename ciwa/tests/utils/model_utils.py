@@ -21,8 +21,9 @@ def create_process(id=None, **kwargs):
 
 
 def create_session(id=None, **kwargs):
+    process = kwargs["process"] if "process" in kwargs else create_process()
     session = Session(
-        process=kwargs.get("process", create_process()),
+        process=process,
         name=kwargs.get("name", "Test Session"),
         description=kwargs.get("description", "A test session"),
         topics_config=kwargs.get("topics_config", []),
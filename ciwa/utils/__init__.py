@@ -9,6 +9,7 @@ from .json_utils import (
     generate_fake_json,
     extract_json_schema,
     is_valid_json_for_schema,
+    get_validator,
     get_json,
     validate_schema,
     SchemaFactory,
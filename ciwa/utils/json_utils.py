@@ -3,6 +3,8 @@
 
 import jsonschema
 from jsonschema import Draft7Validator
+from functools import lru_cache
+import logging
 import random
 import uuid
 from typing import Any, Dict, List, Union
@@ -10,10 +12,11 @@ import string
 import json
 import re
 
+_RANDOM_TEXT_LETTERS = string.ascii_lowercase
+
 
 def generate_random_text(length=10) -> str:
-    letters = string.ascii_lowercase
-    return "".join(random.choice(letters) for i in range(length))
+    return "".join(random.choices(_RANDOM_TEXT_LETTERS, k=length))
 
 
 def generate_fake_json(schema: Dict[str, Any]) -> Dict[str, Any]:
@@ -35,7 +38,8 @@ def generate_fake_json(schema: Dict[str, Any]) -> Dict[str, Any]:
             if prop_schema.get("uniqueItems", False):
                 range_min = item_schema.get("minimum", 1)
                 range_max = item_schema.get("maximum", 100)
-                return random.sample(range(range_min, range_max + 1), max_items)
+                num_items = random.randint(min_items, max_items)
+                return random.sample(range(range_min, range_max + 1), num_items)
             else:
                 return [
                     generate_value(item_schema)
@@ -51,6 +55,10 @@ def generate_fake_json(schema: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+_JSON_CODE_BLOCK_PATTERN = re.compile(r"```json\s*([\s\S]*?)\s*```")
+_JSON_DECODER = json.JSONDecoder()
+
+
 def extract_json(text: str) -> str:
     """
     Extracts the JSON string from the LLM response text.
@@ -62,66 +70,45 @@ def extract_json(text: str) -> str:
         str: The extracted JSON string.
     """
     # Try to find JSON enclosed in code blocks first
-    json_pattern_code_block = r"```json\s*([\s\S]*?)\s*```"
-    match = re.search(json_pattern_code_block, text)
+    match = _JSON_CODE_BLOCK_PATTERN.search(text)
     if match:
         return match.group(1)
 
-    # Try to find standalone JSON objects in the text
-    stack = []
-    json_str = ""
-    inside_json = False
-
-    for char in text:
-        if char == "{":
-            stack.append(char)
-            inside_json = True
-        if inside_json:
-            json_str += char
-        if char == "}":
-            stack.pop()
-            if not stack:
-                inside_json = False
-                try:
-                    json.loads(json_str)
-                    return json_str
-                except json.JSONDecodeError:
-                    json_str = ""
+    # Otherwise return the first standalone JSON object that decodes from a "{"
+    start = text.find("{")
+    while start != -1:
+        try:
+            _, end = _JSON_DECODER.raw_decode(text, start)
+            return text[start:end]
+        except json.JSONDecodeError:
+            start = text.find("{", start + 1)
 
     return ""
 
 
 def extract_json_schema(text: str) -> dict:
-    # Define a regular expression pattern to match JSON-like structures
-    # pattern = re.compile(r"\{[^{}]*\}")
-    # Use a greedy match for the content between the opening { and closing }
-    schema_regex = r'"\$schema":.+\}'
-    pattern = re.compile(schema_regex, re.DOTALL)
-
-    # Find all matches in the text
-    matches = pattern.findall(text)
-
-    for match in matches:
-        try:
-            # Attempt to parse each match as JSON
-            json_obj = json.loads("{" + match.replace("'", '"'))
+    # Decode the JSON object opening just before each "$schema" key, so no regex has
+    # to scan (and backtrack over) the rest of the prompt.
+    position = text.find('"$schema"')
+    while position != -1:
+        start = text.rfind("{", 0, position)
+        if start != -1:
+            try:
+                json_obj, _ = _JSON_DECODER.raw_decode(text, start)
+            except json.JSONDecodeError:
+                json_obj = None
             # Check for the presence of the $schema key
-            if "$schema" in json_obj:
+            if isinstance(json_obj, dict) and "$schema" in json_obj:
                 validate_schema(json_obj)
                 return json_obj
-        except json.JSONDecodeError:
-            continue
+        position = text.find('"$schema"', position + 1)
 
     # If no valid JSON schema is found, return None
     return None
 
 
 def is_valid_json_for_schema(json_data: Dict[str, Any], schema: Dict[str, Any]) -> bool:
-    try:
-        jsonschema.validate(instance=json_data, schema=schema)
-        return True
-    except jsonschema.exceptions.ValidationError:
-        return False
+    return get_validator(schema).is_valid(json_data)
 
 
 def get_json(input_data: Union[str, Dict[str, Any]]) -> Union[Dict[str, Any], None]:
@@ -136,15 +123,14 @@ def get_json(input_data: Union[str, Dict[str, Any]]) -> Union[Dict[str, Any], No
     """
     if isinstance(input_data, str):
         try:
-            data = json.loads(input_data)
-            return data
+            return json.loads(input_data)
         except json.JSONDecodeError as e:
-            print(f"JSON decode error: {e.msg}")
+            logging.warning("JSON decode error: %s", e.msg)
             return None
     elif isinstance(input_data, dict):
         return input_data
     else:
-        print("Invalid input type. Must be a JSON string or a dictionary.")
+        logging.warning("Invalid input type. Must be a JSON string or a dictionary.")
         return None
 
 
@@ -161,9 +147,46 @@ def get_json_string(data: Dict[str, Any]) -> str:
     return json.dumps(data, indent=2)
 
 
+def _schema_key(schema: Dict[str, Any]) -> str:
+    return json.dumps(schema, sort_keys=True)
+
+
+@lru_cache(maxsize=64)
+def _check_schema(schema_key: str) -> None:
+    # Only schemas that pass are cached; a SchemaError propagates uncached.
+    Draft7Validator.check_schema(json.loads(schema_key))
+
+
+@lru_cache(maxsize=64)
+def _get_validator(schema_key: str) -> jsonschema.protocols.Validator:
+    schema = json.loads(schema_key)
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+def get_validator(schema: Dict[str, Any]) -> jsonschema.protocols.Validator:
+    """
+    Returns a compiled validator for a JSON schema, cached by the schema's content.
+
+    Equivalent to what jsonschema.validate builds on every call, but the schema is
+    checked and the validator constructed only once per distinct schema.
+
+    Args:
+        schema (Dict[str, Any]): The schema to validate instances against.
+
+    Returns:
+        jsonschema.protocols.Validator: The validator for the schema.
+
+    Raises:
+        jsonschema.exceptions.SchemaError: If the schema is invalid.
+    """
+    return _get_validator(_schema_key(schema))
+
+
 def validate_schema(schema: Dict[str, Any]) -> None:
     """
-    Validates a JSON schema.
+    Validates a JSON schema. Schemas that have already passed are not re-checked.
 
     Args:
         schema (Dict[str, Any]): The schema to validate.
@@ -172,7 +195,7 @@ def validate_schema(schema: Dict[str, Any]) -> None:
         ValueError: If the schema is invalid.
     """
     try:
-        Draft7Validator.check_schema(schema)
+        _check_schema(_schema_key(schema))
     except jsonschema.exceptions.SchemaError as e:
         raise ValueError(f"Invalid schema: {e.message}") from e
 
@@ -1,8 +1,7 @@
 # utils/notebook_utils.py
 
-from IPython.display import display, JSON, display_markdown
-import matplotlib.pyplot as plt
-import networkx as nx
+# IPython, matplotlib and networkx are imported inside the functions so that importing
+# ciwa does not pay for them outside a notebook.
 
 
 def visualize_session(session: "Session") -> None:
@@ -12,6 +11,9 @@ def visualize_session(session: "Session") -> None:
     Args:
         session (Session): The session to visualize.
     """
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     G = nx.DiGraph()
 
     for topic in session.topics:
@@ -48,21 +50,24 @@ def display_results(session: "Session", aggregated_only: bool = False) -> None:
         session (Session): The session whose results are to be displayed.
         aggregated_only (bool): If True, display only the text of submissions and their aggregated_results 'result' value.
     """
+    from IPython.display import display, JSON, display_markdown
+
     if aggregated_only:
         for topic in session.results["topics"]:
-            display_markdown(
-                f"### **Topic**: {topic['title']}\n\n**Description**: {topic['description']}",
-                raw=True,
-            )
+            # Render each topic as a single markdown block to limit display round-trips.
+            lines = [
+                f"### **Topic**: {topic['title']}\n\n**Description**: {topic['description']}\n"
+            ]
             submissions = {sub["uuid"]: sub["content"] for sub in topic["submissions"]}
+            voting_method = topic["voting_method"]
 
             for submission_result in topic["voting_results"]["aggregated_results"][
                 "submissions"
             ]:
                 submission_uuid = submission_result["uuid"]
-                display_markdown(
-                    f"- **Submission UUID**: {submission_uuid}\n   - **Submission**: {submissions[submission_uuid]}\n   - **{topic['voting_method']} Result**: {submission_result['result']}",
-                    raw=True,
+                lines.append(
+                    f"- **Submission UUID**: {submission_uuid}\n   - **Submission**: {submissions[submission_uuid]}\n   - **{voting_method} Result**: {submission_result['result']}"
                 )
+            display_markdown("\n".join(lines), raw=True)
     else:
         display(JSON(session.results))
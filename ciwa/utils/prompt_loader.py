@@ -3,10 +3,16 @@
 Utility functions for loading prompts from a YAML file.
 """
 
+import copy
 import os
-import inspect
+from typing import Dict, Optional, Tuple
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 
 # Get the absolute path to the prompts.yaml file
 PROMPTS_FILE = os.path.join(
@@ -14,17 +20,57 @@ PROMPTS_FILE = os.path.join(
 )
 
 
-def load_prompts(yaml_file: str = PROMPTS_FILE) -> dict:
+# Parsed prompt files keyed by path, with the (st_mtime_ns, st_size) they were parsed at.
+_prompts_cache: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+# Merged per-class prompts keyed by (class, path), validated the same way.
+_class_prompts_cache: Dict[Tuple[type, str], Tuple[Tuple[int, int], dict]] = {}
+
+
+def _get_file_signature(yaml_file: str) -> Optional[Tuple[int, int]]:
     """
-    Load prompts from a YAML file.
+    Get the modification time and size of a file, or None if it cannot be stat'ed.
+    """
+    try:
+        stat = os.stat(yaml_file)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_prompts_cached(yaml_file: str) -> dict:
+    """
+    Load prompts from a YAML file, reusing the parsed result while the file is unchanged.
+    The returned dict is shared and must not be mutated.
     """
     if not os.path.exists(yaml_file):
         raise FileNotFoundError(f"YAML file not found: {yaml_file}")
+    signature = _get_file_signature(yaml_file)
+    cached = _prompts_cache.get(yaml_file)
+    if signature is not None and cached is not None and cached[0] == signature:
+        return cached[1]
     with open(yaml_file, "r") as file:
-        prompts = yaml.safe_load(file)
+        prompts = yaml.load(file, Loader=SafeLoader)
+    if signature is not None:
+        _prompts_cache[yaml_file] = (signature, prompts)
     return prompts
 
 
+def clear_prompts_cache() -> None:
+    """
+    Clear the caches of parsed prompt files and merged per-class prompts.
+    """
+    _prompts_cache.clear()
+    _class_prompts_cache.clear()
+
+
+def load_prompts(yaml_file: str = PROMPTS_FILE) -> dict:
+    """
+    Load prompts from a YAML file. The file is only re-parsed when its
+    modification time or size changes.
+    """
+    return copy.deepcopy(_load_prompts_cached(yaml_file))
+
+
 def get_prompts(cls: type, yaml_file: str = PROMPTS_FILE) -> dict:
     """
     Get prompts for a class, merging with parent class prompts.
@@ -36,10 +82,18 @@ def get_prompts(cls: type, yaml_file: str = PROMPTS_FILE) -> dict:
     Returns:
         dict: The prompts for the class.
     """
-    prompts = load_prompts(yaml_file)
+    signature = _get_file_signature(yaml_file)
+    cached = _class_prompts_cache.get((cls, yaml_file))
+    if signature is not None and cached is not None and cached[0] == signature:
+        return dict(cached[1])
+
+    prompts = _load_prompts_cached(yaml_file)
     effective_prompts = {}
-    for base in inspect.getmro(cls):
-        class_name = base.__name__
-        if class_name in prompts:
-            effective_prompts = {**prompts[class_name], **effective_prompts}
-    return effective_prompts
+    # Walk from the most generic base down so subclass prompts override inherited ones.
+    for base in reversed(cls.__mro__):
+        class_prompts = prompts.get(base.__name__)
+        if class_prompts:
+            effective_prompts.update(class_prompts)
+    if signature is not None:
+        _class_prompts_cache[(cls, yaml_file)] = (signature, effective_prompts)
+    return dict(effective_prompts)
@@ -4,108 +4,181 @@
 This script provides a robust way to parse the Session JSON data into pandas DataFrames,
 which are ideal for data analysis and manipulation in a Python notebook. 
 """
-from typing import Dict, Union
+from collections import OrderedDict
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Tuple, Union
 from pathlib import Path
 import argparse
-import glob
+import copy
 import os
 import json
-import pandas as pd
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-def parse_session_json(json_data: Union[str, Path, Dict]) -> Dict[str, pd.DataFrame]:
+# Tables built from the most recently used session files, keyed by (absolute path,
+# as_dataframes), with the (st_mtime_ns, st_size) of the file they were built from.
+_SESSION_TABLES_CACHE_SIZE = 8
+_session_tables_cache: OrderedDict[
+    Tuple[str, bool], Tuple[Tuple[int, int], Dict[str, Any]]
+] = OrderedDict()
+
+# Columns with few distinct values per session, stored as pandas categoricals.
+_CATEGORY_COLUMNS = frozenset(
+    ("session_uuid", "topic_uuid", "participant_uuid", "voting_method")
+)
+
+
+def _new_columns(*names: str) -> Dict[str, List[Any]]:
+    """Create an empty list per column name, in column order."""
+    return {name: [] for name in names}
+
+
+def _columns_to_records(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Convert a dict of equal-length column lists into a list of row dicts."""
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+def parse_session_json(
+    json_data: Union[str, Path, Dict, IO[str]], as_dataframes: bool = True
+) -> Dict[str, Union["pd.DataFrame", List[Dict[str, Any]]]]:
     """
     Parse a Session JSON file or dictionary and create pandas DataFrames for participants,
     topics, submissions, and votes.
 
     Args:
-        json_data (Union[str, Path, Dict]): Path to the JSON file, or a dictionary containing
-        the JSON data.
+        json_data (Union[str, Path, Dict, IO[str]]): Path to the JSON file, an open text
+        stream, or a dictionary containing the JSON data.
+        as_dataframes (bool): If False, return each table as a list of row dicts instead
+                              of building pandas DataFrames.
 
     Returns:
-        Dict[str, pd.DataFrame]: A dictionary containing DataFrames for 'participants', 'topics',
-                                 'submissions', and 'votes'.
+        Dict[str, Union[pd.DataFrame, List[Dict[str, Any]]]]: A dictionary containing the
+            'participants', 'topics', 'submissions', and 'votes' tables.
     """
-    # Load JSON data if a file path is provided
+    # Parse files through the cache; they are only re-read when they change on disk
     if isinstance(json_data, (str, Path)):
-        with open(json_data, "r") as f:
-            data = json.load(f)
+        return _parse_session_file(os.path.abspath(json_data), as_dataframes)
     elif isinstance(json_data, dict):
         data = json_data
+    elif hasattr(json_data, "read"):
+        data = json.load(json_data)
     else:
-        raise ValueError("Invalid input type. Expected string, Path, or dictionary.")
+        raise ValueError(
+            "Invalid input type. Expected string, Path, dictionary, or file-like object."
+        )
+    return _build_tables(data, as_dataframes)
+
 
+def _parse_session_file(
+    path: str, as_dataframes: bool
+) -> Dict[str, Union["pd.DataFrame", List[Dict[str, Any]]]]:
+    """
+    Parse a session file, reusing the tables built for it while its modification time
+    and size are unchanged. Callers get copies, so the cached tables are never mutated.
+    Only the most recently used files are kept, so looping over many sessions does not
+    hold all of them in memory.
+    """
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    key = (path, as_dataframes)
+    cached = _session_tables_cache.get(key)
+    if cached is None or cached[0] != signature:
+        with open(path, "r") as f:
+            cached = (signature, _build_tables(json.load(f), as_dataframes))
+        _session_tables_cache[key] = cached
+        if len(_session_tables_cache) > _SESSION_TABLES_CACHE_SIZE:
+            _session_tables_cache.popitem(last=False)
+    _session_tables_cache.move_to_end(key)
+    if as_dataframes:
+        return {name: table.copy() for name, table in cached[1].items()}
+    return copy.deepcopy(cached[1])
+
+
+def _build_tables(
+    data: Dict[str, Any], as_dataframes: bool
+) -> Dict[str, Union["pd.DataFrame", List[Dict[str, Any]]]]:
+    """
+    Build the participants, topics, submissions, and votes tables from session JSON data.
+    """
     # Extract session data
     session = data["session"]
     session_id = session["uuid"]
 
-    # Create participants DataFrame
-    participants_df = pd.DataFrame(data["participants"])
-
-    # Create topics DataFrame
-    topics = []
-    for topic in data["topics"]:
-        topic_data = {
-            "uuid": topic["uuid"],
-            "session_uuid": session_id,
-            "title": topic["title"],
-            "description": topic["description"],
-            "voting_method": topic["voting_method"],
-        }
-        topics.append(topic_data)
-    topics_df = pd.DataFrame(topics)
-
-    # Create submissions DataFrame
-    submissions = []
-    votes = []
+    # Collect topic, submission, and vote columns in a single pass over the topics
+    topic_columns = _new_columns(
+        "uuid", "session_uuid", "title", "description", "voting_method"
+    )
+    submission_columns = _new_columns(
+        "uuid",
+        "topic_uuid",
+        "participant_uuid",
+        "content",
+        "created_at",
+        "aggregated_result",
+    )
+    vote_columns = _new_columns("participant_uuid", "topic_uuid", "created_at", "vote")
     for topic in data["topics"]:
         topic_id = topic["uuid"]
+        topic_columns["uuid"].append(topic_id)
+        topic_columns["session_uuid"].append(session_id)
+        topic_columns["title"].append(topic["title"])
+        topic_columns["description"].append(topic["description"])
+        topic_columns["voting_method"].append(topic["voting_method"])
+
+        voting_results = topic.get("voting_results", {})
+        # Map submission uuid to its aggregated result; reversed so the first entry wins.
+        aggregated_results = {
+            result["uuid"]: result["result"]
+            for result in reversed(
+                voting_results.get("aggregated_results", {}).get("submissions", [])
+            )
+        }
         for submission in topic["submissions"]:
-            submission_data = {
-                "uuid": submission["uuid"],
-                "topic_uuid": topic_id,
-                "participant_uuid": submission["participant_uuid"],
-                "content": submission["content"],
-                "created_at": submission["created_at"],
-            }
-            submissions.append(submission_data)
-
-            # Add aggregated results if available
-            if (
-                "voting_results" in topic
-                and "aggregated_results" in topic["voting_results"]
-            ):
-                for result in topic["voting_results"]["aggregated_results"][
-                    "submissions"
-                ]:
-                    if result["uuid"] == submission["uuid"]:
-                        submission_data["aggregated_result"] = result["result"]
-                        break
+            submission_columns["uuid"].append(submission["uuid"])
+            submission_columns["topic_uuid"].append(topic_id)
+            submission_columns["participant_uuid"].append(
+                submission["participant_uuid"]
+            )
+            submission_columns["content"].append(submission["content"])
+            submission_columns["created_at"].append(submission["created_at"])
+            # None when no aggregated result is available
+            submission_columns["aggregated_result"].append(
+                aggregated_results.get(submission["uuid"])
+            )
 
         # Extract votes
-        if (
-            "voting_results" in topic
-            and "voting_participants" in topic["voting_results"]
-        ):
-            for vote in topic["voting_results"]["voting_participants"]:
-                vote_data = {
-                    "participant_uuid": vote["uuid"],
-                    "topic_uuid": topic_id,
-                    "created_at": vote["vote"]["created_at"],
-                    "vote": json.dumps(
-                        vote["vote"]["vote"]
-                    ),  # Store vote as JSON string
-                }
-                votes.append(vote_data)
-
-    submissions_df = pd.DataFrame(submissions)
-    votes_df = pd.DataFrame(votes)
+        for vote in voting_results.get("voting_participants", []):
+            vote_columns["participant_uuid"].append(vote["uuid"])
+            vote_columns["topic_uuid"].append(topic_id)
+            vote_columns["created_at"].append(vote["vote"]["created_at"])
+            # Store vote as JSON string
+            vote_columns["vote"].append(json.dumps(vote["vote"]["vote"]))
+
+    if not as_dataframes:
+        return {
+            "participants": [dict(p) for p in data["participants"]],
+            "topics": _columns_to_records(topic_columns),
+            "submissions": _columns_to_records(submission_columns),
+            "votes": _columns_to_records(vote_columns),
+        }
+    # Imported here so record-only callers never pay for loading pandas.
+    import pandas as pd
+
+    # Low-cardinality foreign keys become categoricals and timestamps are parsed once.
+    for columns in (topic_columns, submission_columns, vote_columns):
+        for name in _CATEGORY_COLUMNS.intersection(columns):
+            columns[name] = pd.Categorical(columns[name])
+        if "created_at" in columns:
+            columns["created_at"] = pd.to_datetime(
+                columns["created_at"], format="ISO8601"
+            )
 
     return {
-        "participants": participants_df,
-        "topics": topics_df,
-        "submissions": submissions_df,
-        "votes": votes_df,
+        "participants": pd.DataFrame(data["participants"]),
+        "topics": pd.DataFrame(topic_columns),
+        "submissions": pd.DataFrame(submission_columns),
+        "votes": pd.DataFrame(vote_columns),
     }
 
 
@@ -117,10 +190,22 @@ def get_most_recent_session_file() -> str:
     Returns:
         str: Path to the most recent session file.
     """
-    files = glob.glob("Session_*_results.json")
-    if not files:
+    # One directory scan; DirEntry caches the stat result used for ctime.
+    with os.scandir(".") as entries:
+        most_recent = max(
+            (
+                entry
+                for entry in entries
+                if entry.name.startswith("Session_")
+                and entry.name.endswith("_results.json")
+                and entry.is_file()
+            ),
+            key=lambda entry: entry.stat().st_ctime,
+            default=None,
+        )
+    if most_recent is None:
         raise FileNotFoundError("No session files found in the current directory.")
-    return max(files, key=os.path.getctime)
+    return most_recent.name
 
 
 # Example usage